@@ -41,16 +41,34 @@ Legend:
 """
 
 import argparse
-import json
+import os
+import re
 import subprocess
 import sys
+import threading
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Union, List, Dict
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union, List, Dict, Tuple
+from urllib.parse import urlencode, urlsplit
 
+# Modules only needed once we actually talk to the API (http.client alone pulls
+# in ssl and email) are imported where they're used, so `--help` and argument
+# errors return quickly
+if TYPE_CHECKING:
+    import http.client
 
-@dataclass
+
+@dataclass(eq=False, repr=False)
 class Job:
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = (
+        "name", "status", "conclusion", "created_at", "started_at", "completed_at",
+        "created_ts", "started_ts", "completed_ts",
+    )
+
     name: str
     status: str
     conclusion: Optional[str]
@@ -58,6 +76,13 @@ class Job:
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
 
+    def __post_init__(self):
+        # Epoch timestamps for the render loops, which compare them per job;
+        # datetime.timestamp() is comparatively slow, so compute them once here
+        self.created_ts: float = self.created_at.timestamp()
+        self.started_ts: Optional[float] = self.started_at.timestamp() if self.started_at else None
+        self.completed_ts: Optional[float] = self.completed_at.timestamp() if self.completed_at else None
+
     @property
     def queue_duration_seconds(self) -> float:
         if self.started_at:
@@ -77,8 +102,10 @@ class Job:
         return 0
 
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class WorkflowRun:
+    __slots__ = ("id", "name", "status", "conclusion", "created_at", "started_at", "updated_at", "jobs")
+
     id: int
     name: str
     status: str
@@ -91,6 +118,8 @@ class WorkflowRun:
 
 def run_gh(args: List[str]) -> Union[dict, list]:
     """Run gh CLI command and return parsed JSON."""
+    import json
+
     cmd = ["gh"] + args + ["--json"]
     result = subprocess.run(cmd, capture_output=True, text=True)
     if result.returncode != 0:
@@ -100,36 +129,209 @@ def run_gh(args: List[str]) -> Union[dict, list]:
     return json.loads(result.stdout) if result.stdout.strip() else {}
 
 
-def run_gh_api(endpoint: str, repo: str) -> Union[dict, list]:
-    """Run gh api command."""
-    cmd = ["gh", "api", f"repos/{repo}/{endpoint}"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Error running gh api: {result.stderr}", file=sys.stderr)
+GITHUB_API_HOST = "api.github.com"
+
+_token_lock = threading.Lock()
+_token: Optional[str] = None
+
+# Idle keep-alive connections to the API, shared by all fetch threads
+_idle_connections: List["http.client.HTTPSConnection"] = []
+_connections_lock = threading.Lock()
+
+
+def github_token() -> str:
+    """Get a GitHub token, reading it from the environment or gh only once."""
+    global _token
+    with _token_lock:
+        if _token is None:
+            token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+            if not token:
+                result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+                if result.returncode != 0 or not result.stdout.strip():
+                    print(f"Error getting token from gh: {result.stderr}", file=sys.stderr)
+                    sys.exit(1)
+                token = result.stdout.strip()
+            _token = token
+    return _token
+
+
+# Statuses the API answers with for renamed or transferred repositories
+REDIRECT_STATUSES = (301, 302, 307, 308)
+MAX_REDIRECTS = 3
+
+
+def url_path(url: str) -> str:
+    """Path and query of an API URL, to request over a pooled connection."""
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def next_page_path(link: Optional[str]) -> Optional[str]:
+    """Extract the path of the `rel="next"` page from a Link response header."""
+    if not link:
+        return None
+    for part in link.split(","):
+        url, _, params = part.partition(";")
+        if 'rel="next"' in params:
+            return url_path(url.strip().strip("<>"))
+    return None
+
+
+def api_get(path: str) -> Tuple["http.client.HTTPResponse", bytes]:
+    """Make one GET request, reusing an idle keep-alive connection when available."""
+    import http.client
+
+    headers = {
+        "Authorization": f"Bearer {github_token()}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "hurry-ci-timeline",
+    }
+    with _connections_lock:
+        conn = _idle_connections.pop() if _idle_connections else http.client.HTTPSConnection(GITHUB_API_HOST, timeout=60)
+    for attempt in range(2):
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            break
+        except (http.client.HTTPException, OSError) as e:
+            # The server may have dropped an idle keep-alive connection; closing
+            # makes the next request reconnect, so retry once before giving up
+            conn.close()
+            if attempt == 1:
+                print(f"Error calling GitHub API: {e}", file=sys.stderr)
+                sys.exit(1)
+
+    with _connections_lock:
+        _idle_connections.append(conn)
+    return response, body
+
+
+def api_request(path: str) -> Tuple[Union[dict, list], Optional[str]]:
+    """GET a GitHub REST API path, following redirects.
+
+    Returns the parsed JSON body and the path of the next page, if any.
+    """
+    import json
+
+    for _ in range(MAX_REDIRECTS + 1):
+        response, body = api_get(path)
+        location = response.getheader("Location")
+        if response.status not in REDIRECT_STATUSES or not location:
+            break
+        path = url_path(location)
+
+    if response.status != 200:
+        print(f"Error calling GitHub API ({response.status}): {body.decode(errors='replace')}", file=sys.stderr)
         sys.exit(1)
-    return json.loads(result.stdout) if result.stdout.strip() else {}
+    data = json.loads(body) if body.strip() else {}
+    return data, next_page_path(response.getheader("Link"))
+
+
+def run_gh_api(endpoint: str, repo: str) -> Union[dict, list]:
+    """Call a repository endpoint of the GitHub REST API."""
+    data, _ = api_request(f"/repos/{repo}/{endpoint}")
+    return data
+
+
+try:
+    # Optional C extension; much faster than the stdlib when parsing every job
+    # timestamp of a long --history
+    from ciso8601 import parse_datetime as parse_iso8601
+except ImportError:
+    def parse_iso8601(s: str) -> datetime:
+        # Handle Z suffix, which fromisoformat only accepts from Python 3.11
+        if s.endswith('Z'):
+            s = s[:-1] + '+00:00'
+        return datetime.fromisoformat(s)
 
 
 def parse_datetime(s: Optional[str]) -> Optional[datetime]:
     """Parse ISO datetime string."""
     if not s:
         return None
-    # Handle Z suffix
-    if s.endswith('Z'):
-        s = s[:-1] + '+00:00'
-    return datetime.fromisoformat(s)
+    return parse_iso8601(s)
+
+
+# Maximum number of workflow runs fetched concurrently
+MAX_FETCH_WORKERS = 8
 
+# Largest page size the API allows; the default of 30 splits big matrices across pages
+JOBS_PER_PAGE = 100
 
-def get_run_details(run_id: int, repo: str) -> WorkflowRun:
-    """Fetch workflow run and its jobs."""
-    # Get run info
-    run_data = run_gh_api(f"actions/runs/{run_id}", repo)
+# Fields read from the API payloads; the rest (steps, repository, etc.) is
+# dropped as soon as each response is parsed rather than kept and cached
+RUN_FIELDS = (
+    "id", "name", "status", "conclusion", "run_attempt", "created_at", "run_started_at", "updated_at",
+)
+JOB_FIELDS = ("name", "status", "conclusion", "created_at", "started_at", "completed_at")
 
-    # Get jobs for this run
-    jobs_data = run_gh_api(f"actions/runs/{run_id}/jobs", repo)
 
+def get_run_jobs(run_id: int, repo: str) -> List[dict]:
+    """Fetch every job of a workflow run, following pagination."""
     jobs = []
-    for j in jobs_data.get("jobs", []):
+    path: Optional[str] = f"/repos/{repo}/actions/runs/{run_id}/jobs?per_page={JOBS_PER_PAGE}"
+    while path:
+        data, path = api_request(path)
+        jobs.extend({k: j.get(k) for k in JOB_FIELDS} for j in data.get("jobs", []))
+    return jobs
+
+
+def run_cache_path(run_id: int, run_attempt: int, repo: str) -> Path:
+    """Location of the cached API responses for one attempt of a workflow run."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "hurry-timeline" / repo / f"{run_id}-{run_attempt}.json"
+
+
+def load_cached_run(path: Path) -> Optional[dict]:
+    """Load a cache entry, treating unreadable or malformed entries as misses."""
+    import json
+
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or "run" not in entry or "jobs" not in entry:
+        return None
+    return entry
+
+
+def save_cached_run(path: Path, entry: dict) -> None:
+    """Write a cache entry atomically so concurrent readers never see partial JSON."""
+    import json
+    import tempfile
+
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, suffix=".tmp", delete=False) as f:
+            tmp_name = f.name
+            json.dump(entry, f)
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError) as e:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+        # Caching is best effort; the run is simply fetched again next time
+        print(f"Warning: could not cache run: {e}", file=sys.stderr)
+
+
+def cached_run_is_current(entry: dict, run_data: dict) -> bool:
+    """Whether a cache entry was written from the same run attempt and update as `run_data`."""
+    cached = entry["run"]
+    return (
+        cached.get("run_attempt") == run_data.get("run_attempt")
+        and cached.get("updated_at") == run_data.get("updated_at")
+    )
+
+
+def build_workflow_run(run_data: dict, jobs_data: List[dict]) -> WorkflowRun:
+    """Construct a WorkflowRun from API run and job payloads."""
+    jobs = []
+    for j in jobs_data:
         jobs.append(Job(
             name=j["name"],
             status=j["status"],
@@ -151,23 +353,76 @@ def get_run_details(run_id: int, repo: str) -> WorkflowRun:
     )
 
 
-def get_runs_for_pr(pr_number: int, repo: str) -> List[int]:
-    """Get all workflow run IDs for a PR."""
+def get_run_details(run_id: int, repo: str, use_cache: bool = True, run_data: Optional[dict] = None) -> WorkflowRun:
+    """Fetch workflow run and its jobs.
+
+    Completed runs are cached on disk keyed by run ID and attempt, so repeated
+    views of the same run skip fetching its jobs. The run itself is always
+    looked up (unless `run_data` is given, e.g. from a list endpoint) so that a
+    re-run is never answered from the cache.
+    """
+    # fetch_runs already gives each run its own worker, so this run's requests
+    # are made in sequence rather than from yet another thread pool
+    if run_data is None:
+        run_data = run_gh_api(f"actions/runs/{run_id}", repo)
+    run_data = {k: v for k, v in run_data.items() if k in RUN_FIELDS}
+
+    # Re-running a workflow keeps its run ID but bumps run_attempt, and the
+    # entry must also match the current payload's update time
+    cache_path = run_cache_path(run_id, run_data.get("run_attempt") or 1, repo)
+    if use_cache:
+        cached = load_cached_run(cache_path)
+        if cached is not None and cached_run_is_current(cached, run_data):
+            return build_workflow_run(cached["run"], cached["jobs"])
+
+    jobs_data = get_run_jobs(run_id, repo)
+
+    # Only cache once nothing can change; the jobs are fetched separately from
+    # the run, so check them too rather than trusting the run status alone
+    if run_data.get("status") == "completed" and all(j.get("status") == "completed" for j in jobs_data):
+        save_cached_run(cache_path, {"run": run_data, "jobs": jobs_data})
+
+    return build_workflow_run(run_data, jobs_data)
+
+
+def fetch_runs(
+    run_ids: List[int],
+    repo: str,
+    use_cache: bool = True,
+    listed_runs: Optional[List[dict]] = None,
+) -> List[WorkflowRun]:
+    """Fetch details for multiple runs concurrently, preserving input order.
+
+    `listed_runs` are run payloads already returned by a list endpoint (for a
+    branch, PR or commit); runs found there skip their own run lookup, so only
+    their jobs are requested.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not run_ids:
+        return []
+    known = {r["id"]: r for r in listed_runs or []}
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(run_ids))) as pool:
+        return list(pool.map(lambda rid: get_run_details(rid, repo, use_cache, known.get(rid)), run_ids))
+
+
+def get_runs_for_pr(pr_number: int, repo: str) -> List[dict]:
+    """Get all workflow runs for a PR."""
     # Get check runs for the PR's head SHA
     pr_data = run_gh_api(f"pulls/{pr_number}", repo)
     head_sha = pr_data["head"]["sha"]
     return get_runs_for_commit(head_sha, repo)
 
 
-def get_runs_for_commit(sha: str, repo: str) -> List[int]:
-    """Get all workflow run IDs for a commit."""
-    runs_data = run_gh_api(f"actions/runs?head_sha={sha}", repo)
-    return [r["id"] for r in runs_data.get("workflow_runs", [])]
+def get_runs_for_commit(sha: str, repo: str) -> List[dict]:
+    """Get all workflow runs for a commit."""
+    runs_data = run_gh_api(f"actions/runs?{urlencode({'head_sha': sha})}", repo)
+    return runs_data.get("workflow_runs", [])
 
 
 def get_runs_for_branch(branch: str, repo: str, limit: int = 10) -> List[dict]:
     """Get recent workflow runs for a branch."""
-    runs_data = run_gh_api(f"actions/runs?branch={branch}&per_page={limit}", repo)
+    runs_data = run_gh_api(f"actions/runs?{urlencode({'branch': branch, 'per_page': limit})}", repo)
     return runs_data.get("workflow_runs", [])
 
 
@@ -176,9 +431,10 @@ def list_runs(runs_data: List[dict], repo: str) -> str:
     if not runs_data:
         return "No runs found"
 
+    separator = "-" * 90
     lines = []
     lines.append(f"{'Run ID':<12} {'Workflow':<40} {'Status':<12} {'Created':<20}")
-    lines.append("-" * 90)
+    lines.append(separator)
 
     for run in runs_data:
         run_id = run["id"]
@@ -187,7 +443,7 @@ def list_runs(runs_data: List[dict], repo: str) -> str:
         created = run["created_at"][:19].replace("T", " ")
         lines.append(f"{run_id:<12} {workflow:<40} {status:<12} {created:<20}")
 
-    lines.append("-" * 90)
+    lines.append(separator)
     lines.append("")
     lines.append("Use these run IDs with:")
     lines.append(f"  ./timeline.py <run_id> --repo {repo}")
@@ -197,17 +453,80 @@ def list_runs(runs_data: List[dict], repo: str) -> str:
     return "\n".join(lines)
 
 
+@dataclass
+class JobStats:
+    """Aggregate timings over a set of completed jobs."""
+    min_created: datetime
+    max_completed: datetime
+    total_queue: float
+    total_run: float
+    max_queue: float
+    max_total: float
+    last_job: Job
+
+    @property
+    def wall_seconds(self) -> float:
+        return (self.max_completed - self.min_created).total_seconds()
+
+
+def summarize_jobs(jobs: List[Job]) -> Optional[JobStats]:
+    """Gather JobStats in a single pass over jobs, which must all have completed.
+
+    Returns None if there are no jobs. Ties for the last job resolve to the
+    earliest in list order.
+    """
+    if not jobs:
+        return None
+
+    last_job = jobs[0]
+    min_created = last_job.created_at
+    max_queue = last_job.queue_duration_seconds
+    max_total = last_job.total_duration_seconds
+    total_queue = 0
+    total_run = 0
+    for j in jobs:
+        queue = j.queue_duration_seconds
+        total = j.total_duration_seconds
+        total_queue += queue
+        total_run += j.run_duration_seconds
+        if j.created_at < min_created:
+            min_created = j.created_at
+        if j.completed_at > last_job.completed_at:
+            last_job = j
+        if queue > max_queue:
+            max_queue = queue
+        if total > max_total:
+            max_total = total
+
+    return JobStats(
+        min_created=min_created,
+        max_completed=last_job.completed_at,
+        total_queue=total_queue,
+        total_run=total_run,
+        max_queue=max_queue,
+        max_total=max_total,
+        last_job=last_job,
+    )
+
+
 def format_duration(seconds: float) -> str:
     """Format seconds as human-readable duration."""
+    # Output has whole-second granularity, so truncate first to share cache entries
+    return format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=2048)
+def format_whole_seconds(seconds: int) -> str:
+    """Format a whole number of seconds; cached, as the same values recur across a render."""
     if seconds < 60:
-        return f"{int(seconds)}s"
+        return f"{seconds}s"
     elif seconds < 3600:
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
+        mins = seconds // 60
+        secs = seconds % 60
         return f"{mins}m{secs}s"
     else:
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
+        hours = seconds // 3600
+        mins = (seconds % 3600) // 60
         return f"{hours}h{mins}m"
 
 
@@ -215,52 +534,97 @@ def format_duration(seconds: float) -> str:
 SPARK_BLOCKS = " ▁▂▃▄▅▆▇█"
 
 
-def render_sparkline(jobs: List[Job], width: int = 40) -> str:
+@dataclass
+class JobColumns:
+    """Epoch timestamps of jobs that started and completed, as parallel columns.
+
+    Built once per run so the sparkline scans flat float lists instead of
+    pulling fields off each Job.
+    """
+    __slots__ = ("created", "started", "completed")
+
+    created: List[float]
+    started: List[float]
+    completed: List[float]
+
+
+def job_columns(jobs: List[Job]) -> JobColumns:
+    """Collect the timing columns of jobs that have both started and completed."""
+    columns = JobColumns(created=[], started=[], completed=[])
+    for j in jobs:
+        if j.started_ts is not None and j.completed_ts is not None:
+            columns.created.append(j.created_ts)
+            columns.started.append(j.started_ts)
+            columns.completed.append(j.completed_ts)
+    return columns
+
+
+def running_counts(columns: JobColumns, start_ts: float, bucket_seconds: float, width: int) -> List[int]:
+    """Count the jobs running during each of `width` buckets starting at `start_ts`."""
+
+    def bucket_start(i: int) -> float:
+        return start_ts + (i * bucket_seconds)
+
+    def bucket_end(i: int) -> float:
+        return bucket_start(i) + bucket_seconds
+
+    # A job is running during a bucket if it started before the bucket ends and
+    # completed after it starts, which always holds for a contiguous range of
+    # buckets. Rather than testing every job against every bucket, find each
+    # job's range and mark its edges, then prefix-sum the edges into counts.
+    edges = [0] * (width + 1)
+    for started_ts, completed_ts in zip(columns.started, columns.completed):
+        # Estimate the range arithmetically, then settle it against the exact
+        # bucket bounds so float rounding can't move a job across a boundary
+        first = min(width - 1, max(0, int((started_ts - start_ts) // bucket_seconds)))
+        while first > 0 and started_ts < bucket_end(first - 1):
+            first -= 1
+        while first < width and not started_ts < bucket_end(first):
+            first += 1
+
+        last = min(width - 1, max(0, int((completed_ts - start_ts) // bucket_seconds)))
+        while last < width - 1 and completed_ts > bucket_start(last + 1):
+            last += 1
+        while last >= 0 and not completed_ts > bucket_start(last):
+            last -= 1
+
+        if first <= last:
+            edges[first] += 1
+            edges[last + 1] -= 1
+
+    counts = []
+    running_count = 0
+    for i in range(width):
+        running_count += edges[i]
+        counts.append(running_count)
+    return counts
+
+
+def render_sparkline(columns: JobColumns, width: int = 40) -> str:
     """Render job activity over time as a Unicode sparkline.
 
     Each character represents a time bucket. Height indicates how many
     jobs were running (not queued, not finished) during that bucket.
     """
-    if not jobs:
-        return " " * width
-
-    completed_jobs = [j for j in jobs if j.started_at and j.completed_at]
-    if not completed_jobs:
+    if not columns.completed:
         return " " * width
 
-    min_time = min(j.created_at for j in completed_jobs)
-    max_time = max(j.completed_at for j in completed_jobs)
-    total_seconds = (max_time - min_time).total_seconds()
+    min_ts = min(columns.created)
+    total_seconds = max(columns.completed) - min_ts
 
     if total_seconds == 0:
         return "█" * width
 
-    bucket_seconds = total_seconds / width
-    max_parallelism = len(completed_jobs)
+    max_parallelism = len(columns.completed)
+    counts = running_counts(columns, min_ts, total_seconds / width, width)
 
-    result = []
-    for i in range(width):
-        bucket_start = min_time.timestamp() + (i * bucket_seconds)
-        bucket_end = bucket_start + bucket_seconds
-
-        # Count jobs running during this bucket
-        running_count = 0
-        for j in completed_jobs:
-            started_ts = j.started_at.timestamp()
-            completed_ts = j.completed_at.timestamp()
-            # Job is running if it started before bucket ends and completed after bucket starts
-            if started_ts < bucket_end and completed_ts > bucket_start:
-                running_count += 1
-
-        # Map count to block character
-        if running_count == 0:
-            result.append(SPARK_BLOCKS[0])
-        else:
-            # Scale to 1-8 range
-            level = min(8, max(1, int((running_count / max_parallelism) * 8)))
-            result.append(SPARK_BLOCKS[level])
+    # Map each possible count to its block character up front: empty for zero,
+    # otherwise scaled to the 1-8 range
+    blocks = [SPARK_BLOCKS[0]]
+    for count in range(1, max_parallelism + 1):
+        blocks.append(SPARK_BLOCKS[min(8, max(1, int((count / max_parallelism) * 8)))])
 
-    return "".join(result)
+    return "".join(blocks[count] for count in counts)
 
 
 def render_job_bar(queue_secs: float, run_secs: float, max_secs: float, width: int = 16) -> str:
@@ -280,15 +644,23 @@ def render_job_bar(queue_secs: float, run_secs: float, max_secs: float, width: i
     return bar.ljust(width)
 
 
+# Common wrapper patterns stripped from job names, removed in a single pass
+JOB_NAME_NOISE = re.compile("|".join(re.escape(pattern) for pattern in (
+    "build (",
+    ")",
+    "ubuntu-22.04, ",
+    "ubuntu-24.04, ",
+    "macos-14, ",
+    "macos-15, ",
+    "windows-2022, ",
+    "windows-2025, ",
+)))
+
+
 def normalize_job_name(name: str) -> str:
     """Extract a short, normalized job name for matching and display."""
     short = name.split("/")[-1].strip()
-    # Remove common wrapper patterns
-    short = short.replace("build (", "").replace(")", "")
-    short = short.replace("ubuntu-22.04, ", "").replace("ubuntu-24.04, ", "")
-    short = short.replace("macos-14, ", "").replace("macos-15, ", "")
-    short = short.replace("windows-2022, ", "").replace("windows-2025, ", "")
-    return short
+    return JOB_NAME_NOISE.sub("", short)
 
 
 def render_single_run(run: WorkflowRun, width: int = 120) -> str:
@@ -300,33 +672,34 @@ def render_single_run(run: WorkflowRun, width: int = 120) -> str:
     if not jobs:
         return "No completed jobs with timing info"
 
-    min_time = min(j.created_at for j in jobs)
-    max_time = max(j.completed_at for j in jobs)
-    total_seconds = (max_time - min_time).total_seconds()
+    # Sort jobs by total duration (longest first)
+    jobs = sorted(jobs, key=lambda j: j.total_duration_seconds, reverse=True)
+
+    stats = summarize_jobs(jobs)
+    total_seconds = stats.wall_seconds
 
     if total_seconds == 0:
         return "All jobs completed instantly"
 
-    # Sort jobs by total duration (longest first)
-    jobs = sorted(jobs, key=lambda j: j.total_duration_seconds, reverse=True)
-
+    rule = "=" * width
+    separator = "-" * width
     lines = []
 
     # Header
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append(f"Workflow: {run.name} (Run #{run.id})")
     lines.append(f"Status: {run.status} / {run.conclusion or 'in progress'}")
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append("")
 
     # Find max duration for scaling bars
-    max_duration = max(j.total_duration_seconds for j in jobs)
+    max_duration = stats.max_total
     bar_width = 20
     name_width = 40
 
     # Job table with bars
     lines.append(f"{'Job':<{name_width}} {'Timeline':<{bar_width + 2}} {'Queue':>7} {'Run':>7} {'Total':>7}")
-    lines.append("-" * width)
+    lines.append(separator)
 
     for j in jobs:
         short_name = normalize_job_name(j.name)[:name_width - 2]
@@ -336,25 +709,21 @@ def render_single_run(run: WorkflowRun, width: int = 120) -> str:
         total = format_duration(j.total_duration_seconds)
         lines.append(f"{short_name:<{name_width}} {bar}  {queue:>7} {run_time:>7} {total:>7}")
 
-    lines.append("-" * width)
+    lines.append(separator)
 
     # Summary stats
-    total_queue = sum(j.queue_duration_seconds for j in jobs)
-    total_run = sum(j.run_duration_seconds for j in jobs)
-    max_queue = max(j.queue_duration_seconds for j in jobs)
-
     lines.append("")
-    lines.append(f"Wall clock: {format_duration(total_seconds):>10}    Sum of run times: {format_duration(total_run):>10}")
-    lines.append(f"Max queue:  {format_duration(max_queue):>10}    Sum of queue times: {format_duration(total_queue):>10}")
+    lines.append(f"Wall clock: {format_duration(total_seconds):>10}    Sum of run times: {format_duration(stats.total_run):>10}")
+    lines.append(f"Max queue:  {format_duration(stats.max_queue):>10}    Sum of queue times: {format_duration(stats.total_queue):>10}")
 
     # Sparkline showing parallelism over time
-    sparkline = render_sparkline(jobs, width=50)
+    sparkline = render_sparkline(job_columns(jobs), width=50)
     lines.append("")
     lines.append(f"Activity:   {sparkline}")
     lines.append(f"            {'0':^10}{format_duration(total_seconds/2):^30}{format_duration(total_seconds):>10}")
 
     # Critical path
-    last_job = max(jobs, key=lambda j: j.completed_at)
+    last_job = stats.last_job
     lines.append("")
     lines.append(f"Critical path: {normalize_job_name(last_job.name)} (queue {format_duration(last_job.queue_duration_seconds)}, run {format_duration(last_job.run_duration_seconds)})")
 
@@ -367,10 +736,12 @@ def render_single_run(run: WorkflowRun, width: int = 120) -> str:
 
 def render_history(runs: List[WorkflowRun], width: int = 120) -> str:
     """Render a historical view of multiple runs showing trends."""
+    rule = "=" * width
+    separator = "-" * width
     lines = []
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append("RUN HISTORY (oldest to newest)")
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append("")
 
     # Sort runs by time
@@ -379,28 +750,26 @@ def render_history(runs: List[WorkflowRun], width: int = 120) -> str:
     # Header
     sparkline_width = 40
     lines.append(f"{'Run ID':<12} | {'Wall':>7} | {'Build':>7} | {'Queue':>7} | Activity")
-    lines.append("-" * width)
+    lines.append(separator)
 
     for run in runs:
         if not run.jobs:
             continue
         jobs = [j for j in run.jobs if j.completed_at]
-        if not jobs:
+        stats = summarize_jobs(jobs)
+        if not stats:
             continue
 
-        min_t = min(j.created_at for j in jobs)
-        max_t = max(j.completed_at for j in jobs)
-        wall_time = (max_t - min_t).total_seconds()
-
-        build_time = sum(j.run_duration_seconds for j in jobs)
-        queue_time = sum(j.queue_duration_seconds for j in jobs)
+        wall_time = stats.wall_seconds
+        build_time = stats.total_run
+        queue_time = stats.total_queue
 
         # Sparkline showing job activity over time
-        sparkline = render_sparkline(jobs, width=sparkline_width)
+        sparkline = render_sparkline(job_columns(jobs), width=sparkline_width)
 
         lines.append(f"{run.id:<12} | {format_duration(wall_time):>7} | {format_duration(build_time):>7} | {format_duration(queue_time):>7} | {sparkline}")
 
-    lines.append("-" * width)
+    lines.append(separator)
     lines.append("")
     lines.append("Activity: Height shows parallel job count over time (▁▂▃▄▅▆▇█)")
     lines.append("          Low blocks at start = queue delay; sustained height = good parallelism")
@@ -410,50 +779,68 @@ def render_history(runs: List[WorkflowRun], width: int = 120) -> str:
 
 def render_comparison(runs: List[WorkflowRun], width: int = 120) -> str:
     """Render a comparison of multiple workflow runs."""
+    rule = "=" * width
+    separator = "-" * 60
     lines = []
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append("WORKFLOW RUN COMPARISON")
-    lines.append("=" * width)
+    lines.append(rule)
 
     # Group by workflow name
-    by_workflow: Dict[str, List[WorkflowRun]] = {}
+    by_workflow: Dict[str, List[WorkflowRun]] = defaultdict(list)
     for run in runs:
-        by_workflow.setdefault(run.name, []).append(run)
+        by_workflow[run.name].append(run)
 
     for workflow_name, workflow_runs in by_workflow.items():
         lines.append("")
         lines.append(f"Workflow: {workflow_name}")
-        lines.append("-" * 60)
+        lines.append(separator)
 
         for run in workflow_runs:
             if not run.jobs:
                 continue
-            jobs = [j for j in run.jobs if j.completed_at]
-            if not jobs:
+            stats = summarize_jobs([j for j in run.jobs if j.completed_at])
+            if not stats:
                 continue
 
-            min_time = min(j.created_at for j in jobs)
-            max_time = max(j.completed_at for j in jobs)
-            total = (max_time - min_time).total_seconds()
-
-            max_queue = max((j.queue_duration_seconds for j in jobs), default=0)
-
-            lines.append(f"  Run #{run.id}: {format_duration(total)} total, {format_duration(max_queue)} max queue")
+            lines.append(f"  Run #{run.id}: {format_duration(stats.wall_seconds)} total, {format_duration(stats.max_queue)} max queue")
 
     return "\n".join(lines)
 
 
 def render_unified_diff(run1: WorkflowRun, run2: WorkflowRun, width: int = 140) -> str:
     """Render a compact unified comparison of two runs."""
+    rule = "=" * width
+    separator = "-" * width
     lines = []
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append(f"COMPARING: Run #{run1.id} vs #{run2.id}")
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append("")
 
+    def index_jobs(run: WorkflowRun) -> Tuple[Dict[str, Job], float]:
+        """Map completed jobs by normalized name, measuring wall clock time in the same pass.
+
+        Wall clock time covers every completed job, including any that collapse
+        onto the same normalized name.
+        """
+        by_name = {}
+        first_created = None
+        last_completed = None
+        for j in run.jobs:
+            if not j.completed_at:
+                continue
+            by_name[normalize_job_name(j.name)] = j
+            if first_created is None or j.created_at < first_created:
+                first_created = j.created_at
+            if last_completed is None or j.completed_at > last_completed:
+                last_completed = j.completed_at
+        wall_time = (last_completed - first_created).total_seconds() if by_name else 0
+        return by_name, wall_time
+
     # Match jobs by normalized name
-    jobs1 = {normalize_job_name(j.name): j for j in run1.jobs if j.completed_at}
-    jobs2 = {normalize_job_name(j.name): j for j in run2.jobs if j.completed_at}
+    jobs1, wall1 = index_jobs(run1)
+    jobs2, wall2 = index_jobs(run2)
     all_job_names = sorted(set(jobs1.keys()) | set(jobs2.keys()))
 
     # Find max duration across both runs for consistent bar scaling
@@ -470,16 +857,27 @@ def render_unified_diff(run1: WorkflowRun, run2: WorkflowRun, width: int = 140)
 
     # Header
     lines.append(f"{'Job':<{name_width}} {'Run 1':<{bar_width + 8}} {'Run 2':<{bar_width + 8}} {'Delta':>10}")
-    lines.append("-" * width)
+    lines.append(separator)
 
     total_run_delta = 0
     total_queue_delta = 0
+    sum_run1 = 0
+    sum_run2 = 0
+    sum_queue1 = 0
+    sum_queue2 = 0
 
     for name in all_job_names:
         j1 = jobs1.get(name)
         j2 = jobs2.get(name)
         short_name = name[:name_width - 2]
 
+        if j1:
+            sum_run1 += j1.run_duration_seconds
+            sum_queue1 += j1.queue_duration_seconds
+        if j2:
+            sum_run2 += j2.run_duration_seconds
+            sum_queue2 += j2.queue_duration_seconds
+
         if j1 and j2:
             bar1 = render_job_bar(j1.queue_duration_seconds, j1.run_duration_seconds, max_duration, bar_width)
             bar2 = render_job_bar(j2.queue_duration_seconds, j2.run_duration_seconds, max_duration, bar_width)
@@ -507,24 +905,10 @@ def render_unified_diff(run1: WorkflowRun, run2: WorkflowRun, width: int = 140)
             time2 = format_duration(j2.total_duration_seconds)
             lines.append(f"{short_name:<{name_width}} {'(missing)':<{bar_width + 7}}  {bar2} {time2:>6}")
 
-    lines.append("-" * width)
+    lines.append(separator)
 
-    # Wall clock times
-    def get_wall_time(run: WorkflowRun) -> float:
-        jobs = [j for j in run.jobs if j.completed_at]
-        if not jobs:
-            return 0
-        return (max(j.completed_at for j in jobs) - min(j.created_at for j in jobs)).total_seconds()
-
-    wall1 = get_wall_time(run1)
-    wall2 = get_wall_time(run2)
     wall_delta = wall2 - wall1
 
-    sum_run1 = sum(j.run_duration_seconds for j in jobs1.values())
-    sum_run2 = sum(j.run_duration_seconds for j in jobs2.values())
-    sum_queue1 = sum(j.queue_duration_seconds for j in jobs1.values())
-    sum_queue2 = sum(j.queue_duration_seconds for j in jobs2.values())
-
     lines.append("")
     lines.append(f"{'Wall clock:':<{name_width}} {format_duration(wall1):>{bar_width + 7}}  {format_duration(wall2):>{bar_width + 7}}  {'+' if wall_delta > 0 else ''}{format_duration(abs(wall_delta)):>10}")
     lines.append(f"{'Sum of run times:':<{name_width}} {format_duration(sum_run1):>{bar_width + 7}}  {format_duration(sum_run2):>{bar_width + 7}}  {'+' if total_run_delta > 0 else ''}{format_duration(abs(total_run_delta)):>10}")
@@ -532,7 +916,7 @@ def render_unified_diff(run1: WorkflowRun, run2: WorkflowRun, width: int = 140)
 
     # Key insight
     lines.append("")
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append("KEY INSIGHT:")
     if total_run_delta < -60:
         lines.append(f"  Run 2 saved {format_duration(-total_run_delta)} in actual build time across all jobs.")
@@ -553,7 +937,7 @@ def render_unified_diff(run1: WorkflowRun, run2: WorkflowRun, width: int = 140)
         lines.append("")
         lines.append(f"  Build time savings translated to faster wall clock time.")
 
-    lines.append("=" * width)
+    lines.append(rule)
     lines.append("")
     lines.append("Legend: █ running  ░ queued")
 
@@ -573,6 +957,7 @@ def main():
     parser.add_argument("--history", type=int, nargs="*", help="Show history view for multiple run IDs")
     parser.add_argument("--list", action="store_true", help="List runs instead of visualizing")
     parser.add_argument("--limit", type=int, default=10, help="Number of runs to list (default: 10)")
+    parser.add_argument("--no-cache", action="store_true", help="Refetch runs instead of reading the local cache")
 
     args = parser.parse_args()
 
@@ -599,9 +984,9 @@ def main():
         elif args.pr:
             pr_data = run_gh_api(f"pulls/{args.pr}", repo)
             head_sha = pr_data["head"]["sha"]
-            runs_data = run_gh_api(f"actions/runs?head_sha={head_sha}", repo)
+            runs_data = get_runs_for_commit(head_sha, repo)
             print(f"Runs for PR #{args.pr} (head: {head_sha[:8]}):\n")
-            print(list_runs(runs_data.get("workflow_runs", []), repo))
+            print(list_runs(runs_data, repo))
         else:
             # List recent runs for the default branch
             runs_data = get_runs_for_branch("main", repo, args.limit)
@@ -614,6 +999,7 @@ def main():
     # Handle --history mode
     if args.history is not None:
         history_ids = args.history
+        listed_runs = []
 
         # If no run IDs provided, try to get them from --branch or --pr
         if not history_ids:
@@ -623,60 +1009,66 @@ def main():
                     print(f"No workflow runs found for branch {args.branch}", file=sys.stderr)
                     sys.exit(1)
                 history_ids = [r["id"] for r in runs_data]
+                listed_runs = runs_data
             elif args.pr:
                 pr_data = run_gh_api(f"pulls/{args.pr}", repo)
                 head_sha = pr_data["head"]["sha"]
-                runs_data = run_gh_api(f"actions/runs?head_sha={head_sha}", repo)
-                workflow_runs = runs_data.get("workflow_runs", [])
+                workflow_runs = get_runs_for_commit(head_sha, repo)
                 if not workflow_runs:
                     print(f"No workflow runs found for PR #{args.pr}", file=sys.stderr)
                     sys.exit(1)
                 history_ids = [r["id"] for r in workflow_runs]
+                listed_runs = workflow_runs
             else:
                 print("No run IDs provided for --history. Use with --branch or --pr, or provide run IDs.", file=sys.stderr)
                 sys.exit(1)
 
-        history_runs = []
         for rid in history_ids:
             print(f"Fetching run #{rid}...", file=sys.stderr)
-            history_runs.append(get_run_details(rid, repo))
+        history_runs = fetch_runs(history_ids, repo, not args.no_cache, listed_runs)
         print(render_history(history_runs, args.width))
         sys.exit(0)
 
-    # Get run IDs
+    # Get run IDs, keeping any run payloads the lookup already returned
     run_ids = []
+    listed_runs = []
     if args.run_id:
         run_ids = [args.run_id]
     elif args.pr:
-        run_ids = get_runs_for_pr(args.pr, repo)
-        if not run_ids:
+        listed_runs = get_runs_for_pr(args.pr, repo)
+        if not listed_runs:
             print(f"No workflow runs found for PR #{args.pr}", file=sys.stderr)
             sys.exit(1)
+        run_ids = [r["id"] for r in listed_runs]
     elif args.branch:
-        runs_data = get_runs_for_branch(args.branch, repo, 1)
-        if not runs_data:
+        listed_runs = get_runs_for_branch(args.branch, repo, 1)
+        if not listed_runs:
             print(f"No workflow runs found for branch {args.branch}", file=sys.stderr)
             sys.exit(1)
-        run_ids = [runs_data[0]["id"]]
+        run_ids = [listed_runs[0]["id"]]
     elif args.commit:
-        run_ids = get_runs_for_commit(args.commit, repo)
-        if not run_ids:
+        listed_runs = get_runs_for_commit(args.commit, repo)
+        if not listed_runs:
             print(f"No workflow runs found for commit {args.commit}", file=sys.stderr)
             sys.exit(1)
+        run_ids = [r["id"] for r in listed_runs]
     else:
         parser.print_help()
         sys.exit(1)
 
-    # Fetch run details
-    runs = []
+    # Fetch run details, including the comparison run for --diff in the same batch
+    fetch_ids = list(run_ids)
     for run_id in run_ids:
         print(f"Fetching run #{run_id}...", file=sys.stderr)
-        runs.append(get_run_details(run_id, repo))
+    if args.diff:
+        print(f"Fetching comparison run #{args.diff}...", file=sys.stderr)
+        fetch_ids.append(args.diff)
+    fetched = fetch_runs(fetch_ids, repo, not args.no_cache, listed_runs)
+    runs = fetched[:len(run_ids)]
 
     # Handle --diff mode
     if args.diff:
-        print(f"Fetching comparison run #{args.diff}...", file=sys.stderr)
-        diff_run = get_run_details(args.diff, repo)
+        diff_run = fetched[-1]
         print(render_unified_diff(runs[0], diff_run, args.width))
     elif args.compare or len(runs) > 1:
         print(render_comparison(runs, args.width))